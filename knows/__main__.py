@@ -2,14 +2,15 @@ import random
 import sys
 
 from .command_line_interface import CommandLineInterface
-from .graph import Graph
-from .graph_drawer import GraphDrawer
-from .output_format import OutputFormat
 
 
 def main():
     try:
         cli = CommandLineInterface()
+        # Deferred until the arguments are parsed, so --help does not pay for NetworkX, Faker and Matplotlib.
+        from .graph import Graph
+        from .output_format import OutputFormat
+
         num_nodes = cli.args.nodes or random.randint(2, 100)
         num_edges = cli.args.edges or random.randint(num_nodes // 2, num_nodes)
 
@@ -17,16 +18,13 @@ def main():
         graph.generate()
 
         output = OutputFormat(graph)
-        formatted_output = output.to_format(cli.args.format)
-        if cli.args.format == 'svg':
-            sys.stdout.buffer.write(formatted_output.encode('utf-8'))
-        else:
-            print(formatted_output)
+        output.stream_to_format(sys.stdout.buffer, cli.args.format)
+        if cli.args.format != 'svg':
+            sys.stdout.buffer.write(b'\n')
 
         if cli.args.draw:
             try:
-                drawer = GraphDrawer(graph.graph)
-                drawer.configure_and_draw()
+                output.drawer.configure_and_draw()
             except RuntimeError as e:
                 print(f"Error occurred: {e}", file=sys.stderr)
 
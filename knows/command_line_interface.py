@@ -1,4 +1,5 @@
 import argparse
+import functools
 
 
 class CommandLineInterface:
@@ -15,7 +16,16 @@ class CommandLineInterface:
         Returns:
             Namespace: The parsed arguments.
         """
+        return CommandLineInterface._build_parser().parse_args()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_parser():
+        """Builds the argument parser once and reuses it for later parses.
+
+        Returns:
+            ArgumentParser: The configured argument parser.
+        """
         parser = argparse.ArgumentParser(
             description="Knows is a simple property graph benchmark that creates graphs with specified node and edge numbers, supporting multiple output formats and visualization.",
             prog='knows')
@@ -26,4 +36,4 @@ class CommandLineInterface:
                             default='graphml', help="Format to output the graph. Default: graphml.")
         parser.add_argument("-d", "--draw", action="store_true",
                             help="Generate an image of the graph (default is no image). This option may not work in the Docker. If you want to generate an image of the graph, use the svg output format and save it to a file.")
-        return parser.parse_args()
+        return parser
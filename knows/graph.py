@@ -1,15 +1,61 @@
+import itertools
+import math
 import random
+from array import array
+from datetime import date
+from typing import Sequence
 
-import networkx as nx
-from faker import Faker
+DENSE_EDGE_RATIO = 0.3
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+BITSET_MAX_PAIRS = 1 << 28
+INT32_MAX_NODES = 1 << 31
+
+
+def _draw_names(faker, count: int) -> list:
+    """Draws (first name, last name) pairs from Faker's person provider in one batch.
+
+    Faker's first_name() and last_name() rebuild the weighted name tables on every call. Drawing each column
+    with random.choices over cumulative weights gives the same distribution and uses the same seeded RNG.
+
+    Args:
+        faker (Faker): The Faker instance whose locale and RNG are used.
+        count (int): The number of names to draw.
+
+    Returns:
+        list: The drawn (first name, last name) pairs.
+    """
+    provider = faker.first_name.__self__
+    return list(zip(_draw_elements(faker.random, provider.first_names, count),
+                    _draw_elements(faker.random, provider.last_names, count)))
+
+
+def _draw_elements(rng: random.Random, elements, count: int) -> list:
+    """Draws elements with replacement, honouring weights when they are given as a mapping like in Faker.
+
+    Args:
+        rng (random.Random): The random number generator to draw with.
+        elements: A sequence of elements, or a mapping of elements to weights.
+        count (int): The number of elements to draw.
+
+    Returns:
+        list: The drawn elements.
+    """
+    if isinstance(elements, dict):
+        return rng.choices(list(elements), cum_weights=list(itertools.accumulate(elements.values())), k=count)
+    return rng.choices(elements, k=count)
 
 
 class Graph:
     def __init__(self, num_nodes: int, num_edges: int):
+        # Imported here so that the CLI can answer --help without loading NetworkX and Faker.
+        import networkx as nx
+        from faker import Faker
+
         self.graph = nx.DiGraph()
         self.num_nodes = num_nodes
         self.num_edges = num_edges
         self.faker = Faker()
+        self._node_ids = [f"N{i}" for i in range(1, num_nodes + 1)]
 
     def generate(self) -> None:
         self._validate_parameters()
@@ -23,13 +69,121 @@ class Graph:
             raise ValueError("Too many edges for the given number of nodes.")
 
     def _add_nodes(self) -> None:
-        for i in range(1, self.num_nodes + 1):
-            first_name, last_name = self.faker.first_name(), self.faker.last_name()
-            self.graph.add_node(f"N{i}", label='Person', firstname=first_name, lastname=last_name)
+        self.graph.add_nodes_from(
+            (node_id, {'label': 'Person', 'firstname': first_name, 'lastname': last_name})
+            for node_id, (first_name, last_name) in zip(self._node_ids, _draw_names(self.faker, self.num_nodes)))
 
     def _add_edges(self) -> None:
-        nodes = list(self.graph.nodes)
-        while len(self.graph.edges) < self.num_edges:
-            u, v = random.sample(nodes, 2)
-            if not self.graph.has_edge(u, v):
-                self.graph.add_edge(u, v, label='knows', createDate=self.faker.date())
+        node_ids = self._node_ids
+        sources, targets = self._sample_edge_endpoints()
+        dates = self._random_dates(len(sources))
+        self.graph.add_edges_from(
+            (node_ids[u], node_ids[v], {'label': 'knows', 'createDate': create_date})
+            for u, v, create_date in zip(sources, targets, dates))
+
+    def _random_dates(self, count: int) -> list:
+        """Draws random ISO dates between 1970-01-01 and today, like Faker's date(), with Faker's seeded RNG.
+
+        The whole column is drawn at once from day ordinals, which skips Faker's provider dispatch and
+        datetime formatting for every edge. Once there are more dates to draw than days in the range, every
+        day is formatted once and the strings themselves are drawn, so each day is formatted at most once.
+
+        Args:
+            count (int): The number of dates to draw.
+
+        Returns:
+            list: The dates as YYYY-MM-DD strings.
+        """
+        ordinals = range(EPOCH_ORDINAL, date.today().toordinal() + 1)
+        choices = self.faker.random.choices
+        if count > len(ordinals):
+            return choices([date.fromordinal(ordinal).isoformat() for ordinal in ordinals], k=count)
+        return [date.fromordinal(ordinal).isoformat() for ordinal in choices(ordinals, k=count)]
+
+    def _sample_edge_endpoints(self) -> tuple:
+        """Samples distinct edges without self-loops as parallel source and target columns.
+
+        Endpoints are node positions in _node_ids kept in typed arrays, so the sampled edge set takes
+        4 bytes per endpoint (8 for graphs beyond the int32 range) instead of a tuple of two strings per edge
+        until it is added to the graph.
+
+        Returns:
+            tuple: The source and target node positions, as two arrays of equal length.
+        """
+        n = self.num_nodes
+        typecode = 'i' if n <= INT32_MAX_NODES else 'q'
+        sources, targets = array(typecode), array(typecode)
+        for idx in self._sample_pair_indices(n * (n - 1)):
+            u, v = divmod(idx, n - 1)
+            sources.append(u)
+            targets.append(v + (v >= u))
+        return sources, targets
+
+    def _sample_dense_indices(self, num_pairs: int) -> array:
+        """Draws num_edges distinct pair indices with Floyd's algorithm.
+
+        Floyd's algorithm needs exactly one random draw per edge. Drawn indices are tracked in a bitset, which
+        takes one bit per pair instead of the full index list random.sample builds for dense samples.
+
+        Args:
+            num_pairs (int): The number of ordered node pairs, n*(n-1).
+
+        Returns:
+            array: The sampled pair indices.
+        """
+        used = bytearray((num_pairs + 7) >> 3)
+        randrange = random.randrange
+        indices = array('q')
+        for j in range(num_pairs - self.num_edges, num_pairs):
+            idx = randrange(j + 1)
+            if used[idx >> 3] & (1 << (idx & 7)):
+                idx = j
+            used[idx >> 3] |= 1 << (idx & 7)
+            indices.append(idx)
+        return indices
+
+    def _sample_pair_indices(self, num_pairs: int) -> Sequence[int]:
+        """Draws num_edges distinct indices from the ordered pair space.
+
+        Dense graphs sample the whole index space without replacement. Sparse graphs walk it with
+        Batagelj-Brandes geometric skips, which keeps each index with probability num_edges / num_pairs
+        using one random draw per kept index. The walk yields a binomial count, so a surplus of randomly chosen
+        indices is dropped and a shortfall is topped up uniformly, which keeps the result an exact uniform sample.
+
+        Args:
+            num_pairs (int): The number of ordered node pairs, n*(n-1).
+
+        Returns:
+            Sequence[int]: The sampled pair indices, as a list, an array, or a range for complete graphs.
+        """
+        if self.num_edges == 0:
+            return []
+        if self.num_edges == num_pairs:
+            # A complete graph has only one possible edge set, so nothing needs to be drawn.
+            return range(num_pairs)
+        if self.num_edges > DENSE_EDGE_RATIO * num_pairs:
+            if num_pairs <= BITSET_MAX_PAIRS:
+                return self._sample_dense_indices(num_pairs)
+            return random.sample(range(num_pairs), self.num_edges)
+
+        log_q = math.log1p(-self.num_edges / num_pairs)
+        indices = []
+        idx = -1
+        while True:
+            idx += 1 + int(math.log(1.0 - random.random()) / log_q)
+            if idx >= num_pairs:
+                break
+            indices.append(idx)
+
+        if len(indices) >= self.num_edges:
+            # The surplus is only around sqrt(num_edges), so swap-removing it is far cheaper than resampling.
+            randrange = random.randrange
+            for size in range(len(indices), self.num_edges, -1):
+                idx = randrange(size)
+                indices[idx] = indices[-1]
+                indices.pop()
+            return indices
+        seen = set(indices)
+        while len(seen) < self.num_edges:
+            seen.add(random.randrange(num_pairs))
+        return list(seen)
@@ -1,14 +1,35 @@
 # graph_drawer.py
+import importlib.util
 import io
 
 import networkx as nx
 
-try:
-    from matplotlib import pyplot as plt
+# Matplotlib takes longer to import than the rest of knows, so it is only looked up here and imported once a graph
+# is actually drawn.
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+MATPLOTLIB_MISSING_MESSAGE = ("Matplotlib is not available. Drawing functionality is disabled. Use pip install "
+                              "knows[draw] to install the required dependencies.")
 
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+
+def _import_matplotlib(name: str):
+    """Imports a Matplotlib module when a graph is drawn.
+
+    Matplotlib can be installed but still fail to import, for example when numpy is missing or broken. That case
+    raises the same RuntimeError as a missing Matplotlib.
+
+    Args:
+        name (str): The name of the Matplotlib module to import.
+
+    Returns:
+        module: The imported module.
+
+    Raises:
+        RuntimeError: If the module cannot be imported.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise RuntimeError(MATPLOTLIB_MISSING_MESSAGE) from e
 
 
 class GraphDrawer:
@@ -19,10 +40,11 @@ class GraphDrawer:
             graph (networkx.Graph): The graph to be drawn.
         """
         self.graph = graph
+        self._pos = None
+        self._figure = None
 
         if not MATPLOTLIB_AVAILABLE:
-            raise RuntimeError(
-                "Matplotlib is not available. Drawing functionality is disabled. Use pip install knows[draw] to install the required dependencies.")
+            raise RuntimeError(MATPLOTLIB_MISSING_MESSAGE)
 
     def configure_and_draw(self) -> None:
         """Configures and displays the graph.
@@ -30,12 +52,18 @@ class GraphDrawer:
         Sets up the graph to be drawn and then displays it.
         """
         self.draw()
-        plt.show()
+        _import_matplotlib('matplotlib.pyplot').show()
+
+    def draw(self, ax=None) -> None:
+        """Configures the graph drawing settings without displaying it.
 
-    def draw(self) -> None:
-        """Configures the graph drawing settings without displaying it."""
-        nx.draw(self.graph, with_labels=True, node_color='#38b4b6ff', edge_color='#284d5cff', font_color='#203445ff',
-                arrows=True)
+        Args:
+            ax (matplotlib.axes.Axes, optional): The axes to draw on. Defaults to the current pyplot axes.
+        """
+        # nx.draw imports pyplot itself; importing it here first turns a broken install into the usual error.
+        _import_matplotlib('matplotlib.pyplot')
+        nx.draw(self.graph, pos=self._layout(), ax=ax, with_labels=True, node_color='#38b4b6ff',
+                edge_color='#284d5cff', font_color='#203445ff', arrows=True)
 
     def to_svg(self) -> str:
         """Exports the graph to SVG format.
@@ -47,10 +75,21 @@ class GraphDrawer:
             self._draw_to_buffer(buffer)
             return buffer.getvalue().decode('utf-8')
 
-    def _draw_to_buffer(self, buffer: io.BytesIO) -> None:
-        """Helper method for drawing the graph into a buffer for SVG export."""
-        plt.figure(figsize=(10, 8))
-        self.draw()
-        plt.savefig(buffer, format='svg', bbox_inches='tight')
+    def _layout(self) -> dict:
+        """Computes the node positions once, so every drawing and export of this graph shares one layout."""
+        if self._pos is None:
+            self._pos = nx.spring_layout(self.graph)
+        return self._pos
+
+    def _draw_to_buffer(self, buffer: io.BytesIO, image_format: str = 'svg') -> None:
+        """Helper method for drawing the graph into a buffer for export.
+
+        The figure is rendered once and reused by later exports. It is not registered with pyplot, so it is freed
+        together with the drawer and needs no explicit close.
+        """
+        if self._figure is None:
+            self._figure = _import_matplotlib('matplotlib.figure').Figure(figsize=(10, 8))
+            # Full-figure axes, like nx.draw creates on a new figure, so the graph fills the whole image.
+            self.draw(self._figure.add_axes((0, 0, 1, 1)))
+        self._figure.savefig(buffer, format=image_format, bbox_inches='tight')
         buffer.seek(0)
-        plt.close()
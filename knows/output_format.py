@@ -1,10 +1,76 @@
+import inspect
 import io
 import json
+import re
+from functools import cached_property
+from typing import BinaryIO, Iterator
+from xml.etree.ElementTree import ElementTree
 
 import networkx as nx
+from networkx.readwrite.gexf import GEXFWriter
+from networkx.readwrite.graphml import GraphMLWriter
 
 from .graph_drawer import GraphDrawer
 
+# NetworkX 3.4 added the edges keyword and 3.6 switched its default key from "links" to "edges". Pinning it keeps
+# the JSON layout stable across versions; the signature is inspected once here rather than on every export.
+_NODE_LINK_KWARGS = {'edges': 'links'} if 'edges' in inspect.signature(nx.node_link_data).parameters else {}
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_YARSPG_ESCAPE = str.maketrans({'"': '\\"', '\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+_YARSPG_NEEDS_ESCAPE = re.compile(r'["\\\n\r\t]').search
+
+
+def _escape_yarspg(value) -> str:
+    """Escapes a value for use inside a double-quoted YARS-PG string.
+
+    Most values contain nothing to escape, so a regex scan guards the slower translate call.
+
+    Args:
+        value: The value to escape.
+
+    Returns:
+        str: The escaped string.
+    """
+    value = str(value)
+    return value if _YARSPG_NEEDS_ESCAPE(value) is None else value.translate(_YARSPG_ESCAPE)
+
+
+def _format_properties_yarspg(attributes: dict) -> str:
+    """Formats the properties of a node or an edge, except its label, as a YARS-PG property list.
+
+    Args:
+        attributes (dict): The attributes of the node or edge.
+
+    Returns:
+        str: The comma-separated "key": "value" pairs.
+    """
+    # A list comprehension rather than a generator: str.join builds a list from a generator first anyway.
+    return ', '.join([f'"{key}": "{_escape_yarspg(value)}"' for key, value in attributes.items() if key != 'label'])
+
+
+def _write_xml(writer, fp: BinaryIO) -> None:
+    """Serializes the element tree of a NetworkX GraphML or GEXF writer into a binary file object.
+
+    nx.generate_graphml and nx.generate_gexf render the whole tree to one string and split it into lines. Writing
+    the tree directly gives the same bytes: us-ascii with no XML declaration is what their tostring call produces,
+    whereas nx.write_graphml and nx.write_gexf would add a declaration and write UTF-8.
+
+    Args:
+        writer (GraphMLWriter | GEXFWriter): A writer whose graph element has been added.
+        fp (BinaryIO): The binary file object to write to.
+    """
+    writer.indent(writer.xml)
+    # indent() ends the root element with a newline, which splitting into lines drops.
+    writer.xml.tail = None
+    ElementTree(writer.xml).write(fp, encoding='us-ascii')
+
 
 class OutputFormat:
     """A class to represent various output formats of a graph.
@@ -13,6 +79,14 @@ class OutputFormat:
         graph (Graph): An instance of the Graph class.
     """
 
+    # Method names rather than bound methods, so that a conversion does not build a dispatch table each time.
+    _FORMAT_METHODS = {'graphml': '_to_graphml', 'yarspg': '_to_yarspg', 'gexf': '_to_gexf', 'gml': '_to_gml',
+        'svg': '_to_svg', 'adjacency_list': '_to_adjacency_list',
+        'multiline_adjacency_list': '_to_multiline_adjacency_list', 'edge_list': '_to_edge_list', 'json': '_to_json'}
+    _WRITE_METHODS = {'graphml': '_write_graphml', 'gexf': '_write_gexf'}
+    _LINE_METHODS = {'yarspg': '_yarspg_lines', 'gml': '_gml_lines', 'adjacency_list': '_adjacency_list_lines',
+        'multiline_adjacency_list': '_multiline_adjacency_list_lines', 'edge_list': '_edge_list_lines'}
+
     def __init__(self, graph):
         """Inits OutputFormat with a graph.
 
@@ -30,11 +104,52 @@ class OutputFormat:
         Returns:
             str: The graph in the specified format.
         """
-        format_methods = {'graphml': self._to_graphml, 'yarspg': self._to_yarspg, 'gexf': self._to_gexf,
-            'gml': self._to_gml, 'svg': self._to_svg, 'adjacency_list': self._to_adjacency_list,
-            'multiline_adjacency_list': self._to_multiline_adjacency_list, 'edge_list': self._to_edge_list,
-            'json': self._to_json}
-        return format_methods[format_type]()
+        return getattr(self, self._FORMAT_METHODS[format_type])()
+
+    def to_formats(self, format_types: list) -> dict:
+        """Converts the graph to several formats at once.
+
+        This is library API; the CLI writes a single format with stream_to_format. Image formats share one drawer,
+        so the graph layout is computed and rendered only once.
+
+        Args:
+            format_types (list): The format types to convert the graph into.
+
+        Returns:
+            dict: The graph in each specified format, keyed by format type.
+        """
+        return {format_type: self.to_format(format_type) for format_type in format_types}
+
+    @cached_property
+    def drawer(self) -> GraphDrawer:
+        """GraphDrawer: The drawer shared by all image exports and drawings of the graph."""
+        return GraphDrawer(self.graph.graph)
+
+    def stream_to_format(self, fp: BinaryIO, format_type: str) -> None:
+        """Writes the graph in a specified format to a binary file object.
+
+        GraphML and GEXF are serialized from their XML element tree straight into fp, and the other line-based
+        formats are encoded and written one line at a time, so none of them is held in memory as a single string.
+        JSON and SVG are written from to_format. The written bytes equal the UTF-8 encoding of
+        to_format(format_type).
+
+        Args:
+            fp (BinaryIO): The binary file object to write to.
+            format_type (str): The format type to convert the graph into.
+        """
+        write_method = self._WRITE_METHODS.get(format_type)
+        if write_method is not None:
+            getattr(self, write_method)(fp)
+            return
+        line_method = self._LINE_METHODS.get(format_type)
+        if line_method is None:
+            fp.write(self.to_format(format_type).encode('utf-8'))
+            return
+        separator = b''
+        for line in getattr(self, line_method)():
+            fp.write(separator)
+            fp.write(line.encode('utf-8'))
+            separator = b'\n'
 
     def _to_graphml(self) -> str:
         """Converts the graph to GraphML format.
@@ -42,7 +157,31 @@ class OutputFormat:
         Returns:
             str: The graph in GraphML format.
         """
-        return '\n'.join(nx.generate_graphml(self.graph.graph))
+        return self._to_xml_string(self._write_graphml)
+
+    @staticmethod
+    def _to_xml_string(write_method) -> str:
+        """Runs an XML write method into an in-memory buffer and returns its output as a string.
+
+        Args:
+            write_method (Callable[[BinaryIO], None]): The bound _write_graphml or _write_gexf method.
+
+        Returns:
+            str: The written XML document.
+        """
+        with io.BytesIO() as buffer:
+            write_method(buffer)
+            return buffer.getvalue().decode('ascii')
+
+    def _write_graphml(self, fp: BinaryIO) -> None:
+        """Writes the graph in GraphML format to a binary file object.
+
+        Args:
+            fp (BinaryIO): The binary file object to write to.
+        """
+        writer = GraphMLWriter()
+        writer.add_graph_element(self.graph.graph)
+        _write_xml(writer, fp)
 
     def _to_yarspg(self) -> str:
         """Converts the graph to YARS-PG format.
@@ -50,9 +189,14 @@ class OutputFormat:
         Returns:
             str: The graph in YARS-PG format.
         """
-        nodes_output = [self._format_node_yarspg(node) for node in self.graph.graph.nodes(data=True)]
-        edges_output = [self._format_edge_yarspg(edge) for edge in self.graph.graph.edges(data=True)]
-        return '\n'.join(nodes_output + edges_output)
+        return '\n'.join(self._yarspg_lines())
+
+    def _yarspg_lines(self) -> Iterator[str]:
+        """Generates the lines of the graph in YARS-PG format, nodes first."""
+        for node in self.graph.graph.nodes(data=True):
+            yield self._format_node_yarspg(node)
+        for edge in self.graph.graph.edges(data=True):
+            yield self._format_edge_yarspg(edge)
 
     @staticmethod
     def _format_node_yarspg(node: tuple) -> str:
@@ -65,8 +209,8 @@ class OutputFormat:
             str: The node in YARS-PG format.
         """
         node_id, attributes = node
-        label = attributes.get('label', 'label')
-        prop_list = ', '.join([f'"{key}": "{value}"' for key, value in attributes.items() if key != 'label'])
+        label = _escape_yarspg(attributes.get('label', 'label'))
+        prop_list = _format_properties_yarspg(attributes)
         return f"({node_id} {{\"{label}\"}}[{prop_list}])"
 
     @staticmethod
@@ -80,8 +224,8 @@ class OutputFormat:
             str: The edge in YARS-PG format.
         """
         u, v, attributes = edge
-        label = attributes.get('label', 'label')
-        prop_list = ', '.join([f'"{key}": "{value}"' for key, value in attributes.items() if key != 'label'])
+        label = _escape_yarspg(attributes.get('label', 'label'))
+        prop_list = _format_properties_yarspg(attributes)
         return f"({u})-({{\"{label}\"}}[{prop_list}])->({v})"
 
     def _to_svg(self) -> str:
@@ -90,10 +234,7 @@ class OutputFormat:
         Returns:
             str: The graph in SVG format.
         """
-        drawer = GraphDrawer(self.graph.graph)
-        with io.BytesIO() as buffer:
-            drawer._draw_to_buffer(buffer)
-            return buffer.getvalue().decode('utf-8')
+        return self.drawer.to_svg()
 
     def _to_gexf(self) -> str:
         """Converts the graph to GEXF format.
@@ -101,7 +242,17 @@ class OutputFormat:
         Returns:
             str: The graph in GEXF format.
         """
-        return '\n'.join(nx.generate_gexf(self.graph.graph))
+        return self._to_xml_string(self._write_gexf)
+
+    def _write_gexf(self, fp: BinaryIO) -> None:
+        """Writes the graph in GEXF format to a binary file object.
+
+        Args:
+            fp (BinaryIO): The binary file object to write to.
+        """
+        writer = GEXFWriter()
+        writer.add_graph(self.graph.graph)
+        _write_xml(writer, fp)
 
     def _to_gml(self) -> str:
         """Converts the graph to GML format.
@@ -109,7 +260,11 @@ class OutputFormat:
         Returns:
             str: The graph in GML format.
         """
-        return '\n'.join(nx.generate_gml(self.graph.graph))
+        return '\n'.join(self._gml_lines())
+
+    def _gml_lines(self) -> Iterator[str]:
+        """Generates the lines of the graph in GML format."""
+        return nx.generate_gml(self.graph.graph)
 
     def _to_adjacency_list(self) -> str:
         """Converts the graph to adjacency list format.
@@ -117,7 +272,16 @@ class OutputFormat:
         Returns:
             str: The graph in adjacency list format.
         """
-        return '\n'.join(nx.generate_adjlist(self.graph.graph))
+        return '\n'.join(self._adjacency_list_lines())
+
+    def _adjacency_list_lines(self) -> Iterator[str]:
+        """Generates the lines of the graph in adjacency list format.
+
+        The lines equal those of nx.generate_adjlist, which handles undirected graphs and multigraphs as well.
+        Generated graphs are simple directed graphs, so the successor dicts are read directly.
+        """
+        for node, successors in self.graph.graph._succ.items():
+            yield ' '.join([str(node), *map(str, successors)])
 
     def _to_multiline_adjacency_list(self) -> str:
         """Converts the graph to multiline adjacency list format.
@@ -125,7 +289,11 @@ class OutputFormat:
         Returns:
             str: The graph in multiline adjacency list format.
         """
-        return '\n'.join(nx.generate_multiline_adjlist(self.graph.graph))
+        return '\n'.join(self._multiline_adjacency_list_lines())
+
+    def _multiline_adjacency_list_lines(self) -> Iterator[str]:
+        """Generates the lines of the graph in multiline adjacency list format."""
+        return nx.generate_multiline_adjlist(self.graph.graph)
 
     def _to_edge_list(self) -> str:
         """Converts the graph to edge list format.
@@ -133,7 +301,16 @@ class OutputFormat:
         Returns:
             str: The graph in edge list format.
         """
-        return '\n'.join(nx.generate_edgelist(self.graph.graph, data=True))
+        return '\n'.join(self._edge_list_lines())
+
+    def _edge_list_lines(self) -> Iterator[str]:
+        """Generates the lines of the graph in edge list format.
+
+        The lines equal those of nx.generate_edgelist with data=True, without going through the edge view.
+        """
+        for u, successors in self.graph.graph._succ.items():
+            for v, attributes in successors.items():
+                yield f'{u} {v} {attributes}'
 
     def _to_json(self) -> str:
         """Converts the graph to JSON format.
@@ -141,4 +318,8 @@ class OutputFormat:
         Returns:
             str: The graph in JSON format.
         """
-        return json.dumps(nx.node_link_data(self.graph.graph))
+        data = nx.node_link_data(self.graph.graph, **_NODE_LINK_KWARGS)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data).decode('utf-8')
+        # Same layout as orjson, so the output does not depend on which encoder is installed.
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
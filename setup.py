@@ -14,7 +14,7 @@ setuptools.setup(
     author="Łukasz Szeremeta",
     author_email="l.szeremeta.dev+knows@gmail.com",
     install_requires=["networkx>=3.0.0", "Faker>=19.0.0"],
-    extras_require={"draw": ["matplotlib>=3.7.0"]},
+    extras_require={"draw": ["matplotlib>=3.7.0"], "fast": ["orjson>=3.9.0"]},
     tests_require=["pytest>=7.0.0"],
     license="MIT License",
     description="Property graph benchmark that creates graphs with specified node and edge numbers, supporting multiple output formats and visualization",
@@ -46,3 +46,20 @@ def test_cli_various_args(monkeypatch, args, expected_nodes, expected_edges, exp
     assert cli.args.edges == expected_edges
     assert cli.args.format == expected_format
     assert cli.args.draw == expected_draw
+
+
+def test_cli_reuses_parser(monkeypatch):
+    """
+    Test if the argument parser is built once and reused across parses.
+
+    Args:
+        monkeypatch: A pytest fixture for monkey-patching.
+    """
+    monkeypatch.setattr('sys.argv', ['prog', '5', '4'])
+    first = CommandLineInterface()
+    monkeypatch.setattr('sys.argv', ['prog', '-f', 'json'])
+    second = CommandLineInterface()
+    assert CommandLineInterface._build_parser() is CommandLineInterface._build_parser()
+    assert first.args.nodes == 5
+    assert second.args.nodes is None
+    assert second.args.format == 'json'
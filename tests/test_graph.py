@@ -1,3 +1,6 @@
+from datetime import date
+
+import networkx as nx
 import pytest
 
 from knows.graph import Graph
@@ -40,3 +43,70 @@ def test_graph_node_attributes_are_correctly_set():
         assert 'firstname' in attributes
         assert 'lastname' in attributes
         assert attributes['label'] == 'Person'
+
+
+@pytest.mark.parametrize("num_nodes, num_edges", [(4, 12), (10, 80), (50, 30)])
+def test_graph_edges_are_unique_and_without_self_loops(num_nodes: int, num_edges: int):
+    """
+    Test if the generated edges are distinct and contain no self-loops.
+
+    Covers complete, dense and sparse graphs, which are sampled with different strategies.
+
+    Args:
+        num_nodes (int): The number of nodes in the graph.
+        num_edges (int): The number of edges in the graph.
+    """
+    graph = Graph(num_nodes, num_edges)
+    graph.generate()
+    assert len(graph.graph.edges) == num_edges
+    assert nx.number_of_selfloops(graph.graph) == 0
+    for _, _, attributes in graph.graph.edges(data=True):
+        assert attributes['label'] == 'knows'
+        assert 'createDate' in attributes
+
+
+def test_graph_edge_create_dates_are_valid_iso_dates():
+    """
+    Test if the edge createDate values are ISO dates between 1970-01-01 and today.
+    """
+    graph = Graph(20, 50)
+    graph.generate()
+    for _, _, attributes in graph.graph.edges(data=True):
+        create_date = date.fromisoformat(attributes['createDate'])
+        assert date(1970, 1, 1) <= create_date <= date.today()
+
+
+def test_graph_edge_create_dates_follow_faker_seed():
+    """
+    Test if seeding the graph's Faker instance reproduces the edge createDate values.
+    """
+    first, second = Graph(2, 1), Graph(2, 1)
+    first.faker.seed_instance(7)
+    second.faker.seed_instance(7)
+    assert first._random_dates(30) == second._random_dates(30)
+
+
+def test_graph_edge_endpoints_fall_back_to_64_bit(monkeypatch):
+    """
+    Test if sampled edge endpoints use 32-bit items, and 64-bit items when node positions may not fit.
+
+    Args:
+        monkeypatch: A pytest fixture for monkey-patching.
+    """
+    graph = Graph(6, 10)
+    sources, targets = graph._sample_edge_endpoints()
+    assert sources.itemsize == targets.itemsize == 4
+    monkeypatch.setattr('knows.graph.INT32_MAX_NODES', 5)
+    wide_sources, wide_targets = graph._sample_edge_endpoints()
+    assert wide_sources.itemsize == wide_targets.itemsize == 8
+    assert len(set(zip(wide_sources, wide_targets))) == 10
+
+
+def test_graph_sparse_sampling_with_tiny_edge_ratio():
+    """
+    Test if sparse sampling works when the edge ratio is too small for 1.0 - ratio to differ from 1.0.
+    """
+    graph = Graph(2, 5)
+    indices = graph._sample_pair_indices(10 ** 18)
+    assert len(set(indices)) == 5
+    assert all(0 <= idx < 10 ** 18 for idx in indices)
@@ -1,6 +1,9 @@
+import subprocess
+import sys
 from unittest.mock import patch
 
 import networkx as nx
+import pytest
 
 from knows.graph_drawer import GraphDrawer
 
@@ -80,3 +83,59 @@ def test_configure_and_draw_calls_show(mock_show):
     drawer = GraphDrawer(graph)
     drawer.configure_and_draw()
     mock_show.assert_called_once()
+
+
+def test_layout_is_reused_across_exports():
+    """
+    Tests whether repeated exports of the same drawer reuse one layout and one rendered figure.
+    """
+    graph = nx.DiGraph()
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 3)
+    drawer = GraphDrawer(graph)
+    first_svg = drawer.to_svg()
+    pos, figure = drawer._pos, drawer._figure
+    second_svg = drawer.to_svg()
+    assert drawer._pos is pos
+    assert drawer._figure is figure
+    assert '<svg' in first_svg and '<svg' in second_svg
+
+
+def test_svg_fills_the_whole_figure():
+    """
+    Tests whether the exported graph is drawn on axes that span the whole figure, like nx.draw on a new figure.
+    """
+    graph = nx.DiGraph()
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 3)
+    drawer = GraphDrawer(graph)
+    drawer.to_svg()
+    (axes,) = drawer._figure.axes
+    assert tuple(axes.get_position().bounds) == pytest.approx((0, 0, 1, 1))
+
+
+def test_matplotlib_is_imported_only_when_drawing():
+    """
+    Tests whether importing the output formats leaves Matplotlib unimported until a graph is drawn.
+    """
+    code = 'import sys, knows.output_format; print("matplotlib" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+
+def test_broken_matplotlib_install_raises_runtime_error(monkeypatch):
+    """
+    Tests whether drawing and exporting raise the usual RuntimeError when Matplotlib is installed but cannot be imported.
+
+    Args:
+        monkeypatch: A pytest fixture for monkey-patching.
+    """
+    monkeypatch.setitem(sys.modules, 'matplotlib.pyplot', None)
+    monkeypatch.setitem(sys.modules, 'matplotlib.figure', None)
+    graph = nx.DiGraph()
+    graph.add_edge(1, 2)
+    drawer = GraphDrawer(graph)
+    with pytest.raises(RuntimeError, match='pip install knows'):
+        drawer.to_svg()
+    with pytest.raises(RuntimeError, match='pip install knows'):
+        drawer.configure_and_draw()
@@ -1,6 +1,12 @@
+import io
 import json
+from unittest.mock import patch
+
+import networkx as nx
+import pytest
 
 from knows.graph import Graph
+from knows.graph_drawer import GraphDrawer
 from knows.output_format import OutputFormat
 
 
@@ -82,3 +88,98 @@ def test_output_format_adjacency_list():
     output_format = OutputFormat(graph)
     adjacency_list_output = output_format.to_format('adjacency_list')
     assert len(adjacency_list_output.splitlines()) >= 3  # At least 3 lines: 2 nodes, 1 edge
+
+
+@pytest.mark.parametrize("format_type", ['graphml', 'yarspg', 'gexf', 'gml', 'adjacency_list',
+                                         'multiline_adjacency_list', 'edge_list', 'json'])
+def test_stream_to_format_matches_to_format(format_type: str):
+    """
+    Tests if streaming a format to a binary file object writes the same content as to_format returns.
+
+    Args:
+        format_type (str): The format type to check.
+    """
+    graph = Graph(5, 6)
+    graph.generate()
+    output_format = OutputFormat(graph)
+    with io.BytesIO() as buffer:
+        output_format.stream_to_format(buffer, format_type)
+        assert buffer.getvalue().decode('utf-8') == output_format.to_format(format_type)
+
+
+def test_output_format_yarspg_escapes_strings():
+    """
+    Tests if quotes, backslashes and line breaks in YARS-PG property values are escaped.
+    """
+    graph = Graph(2, 0)
+    graph.generate()
+    graph.graph.nodes['N1']['lastname'] = 'O"Neil\\\nJr'
+    output_format = OutputFormat(graph)
+    yarspg_output = output_format.to_format('yarspg')
+    assert '"lastname": "O\\"Neil\\\\\\nJr"' in yarspg_output
+    assert len(yarspg_output.splitlines()) == 2
+
+
+def test_output_format_json_without_orjson(monkeypatch):
+    """
+    Tests if the JSON output falls back to the standard library, with the same output, when orjson is not available.
+
+    Args:
+        monkeypatch: A pytest fixture for monkey-patching.
+    """
+    graph = Graph(3, 2)
+    graph.generate()
+    output_format = OutputFormat(graph)
+    default_output = output_format.to_format('json')
+    monkeypatch.setattr('knows.output_format.ORJSON_AVAILABLE', False)
+    assert output_format.to_format('json') == default_output
+
+
+def test_output_format_to_formats_shares_drawer():
+    """
+    Tests if converting to several formats returns each format and reuses one drawer for images.
+    """
+    graph = Graph(3, 2)
+    graph.generate()
+    output_format = OutputFormat(graph)
+    outputs = output_format.to_formats(['graphml', 'svg', 'json'])
+    assert set(outputs) == {'graphml', 'svg', 'json'}
+    assert '<graphml' in outputs['graphml']
+    assert '<svg' in outputs['svg']
+
+
+def test_output_format_image_exports_share_one_drawer_and_layout():
+    """
+    Tests if repeated image exports construct one drawer and compute the spring layout only once.
+    """
+    graph = Graph(3, 2)
+    graph.generate()
+    output_format = OutputFormat(graph)
+    with patch('knows.output_format.GraphDrawer', wraps=GraphDrawer) as drawer_class, \
+            patch('networkx.spring_layout', wraps=nx.spring_layout) as spring_layout:
+        output_format.to_formats(['svg', 'svg'])
+        output_format.to_format('svg')
+    assert drawer_class.call_count == 1
+    assert spring_layout.call_count == 1
+
+
+def test_adjacency_and_edge_lists_match_networkx():
+    """
+    Tests if the adjacency list and edge list formats equal the output of the NetworkX generators.
+    """
+    graph = Graph(10, 40)
+    graph.generate()
+    output_format = OutputFormat(graph)
+    assert output_format.to_format('adjacency_list') == '\n'.join(nx.generate_adjlist(graph.graph))
+    assert output_format.to_format('edge_list') == '\n'.join(nx.generate_edgelist(graph.graph, data=True))
+
+
+def test_xml_formats_match_networkx():
+    """
+    Tests if the GraphML and GEXF formats equal the joined lines of the NetworkX generators.
+    """
+    graph = Graph(10, 40)
+    graph.generate()
+    output_format = OutputFormat(graph)
+    assert output_format.to_format('graphml') == '\n'.join(nx.generate_graphml(graph.graph))
+    assert output_format.to_format('gexf') == '\n'.join(nx.generate_gexf(graph.graph))